@@ -12,8 +12,23 @@ E.g.:
 """
 
 import time
+from array import array
+from bisect import bisect_left, bisect_right
 from enum import Enum
 
+# Only elapsed time matters, so use a clock that is not affected by wall-clock jumps
+_MONOTONIC = time.monotonic
+
+
+def _interpolate(x, xs, ys):
+    """Linearly interpolate x on the ascending breakpoints xs, clamped to the ends."""
+    i = bisect_left(xs, x)
+    if i == 0:
+        return ys[0]
+    if i == len(xs):
+        return ys[-1]
+    return ys[i - 1] + (x - xs[i - 1]) / (xs[i] - xs[i - 1]) * (ys[i] - ys[i - 1])
+
 
 class PositionType(Enum):
     """Enum class for different type of calculated positions."""
@@ -36,6 +51,35 @@ class TravelCalculator:
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = (
+        "position_type",
+        "last_known_position",
+        "travel_time_down",
+        "travel_time_up",
+        "travel_to_position",
+        "travel_started_time",
+        "travel_direction",
+        "_direction_sign",
+        "position_closed",
+        "position_open",
+        "time_set_from_outside",
+        "segments_up",
+        "segments_down",
+        "_up_pos",
+        "_up_cum_time",
+        "_down_pos",
+        "_down_cum_time",
+        "_travel_pos",
+        "_travel_cum_time",
+        "_travel_speed",
+        "_travel_boundary_index",
+        "_travel_boundary_time",
+    )
+
+    # Class-level aliases save the module and enum lookups on the polling path
+    _CALCULATED = PositionType.CALCULATED
+    _STOPPED = TravelStatus.STOPPED
+
     def __init__(
         self,
         travel_time_down=None,
@@ -60,6 +104,8 @@ class TravelCalculator:
         self.travel_to_position = 0
         self.travel_started_time = 0
         self.travel_direction = TravelStatus.STOPPED
+        # +1 while traveling up, -1 while traveling down, 0 when stopped
+        self._direction_sign = 0
 
         # 0 is closed, 100 is fully open
         self.position_closed = 0
@@ -84,31 +130,100 @@ class TravelCalculator:
                 "Either segments_down or travel_time_down must be provided"
             )
 
+        # Segment end positions and durations as parallel float arrays
+        seg_up_pos = array("d", [seg_end for seg_end, _ in self.segments_up])
+        seg_up_dur = array("d", [seg_time for _, seg_time in self.segments_up])
+        seg_down_pos = array("d", [seg_end for seg_end, _ in self.segments_down])
+        seg_down_dur = array("d", [seg_time for _, seg_time in self.segments_down])
+
+        # Cumulative position/time tables for fast lookups while traveling
+        self._up_pos, self._up_cum_time = self._build_segment_tables(
+            seg_up_pos, seg_up_dur
+        )
+        self._down_pos, self._down_cum_time = self._build_segment_tables(
+            seg_down_pos, seg_down_dur
+        )
+
+        # Table of the current travel, set by start_travel together with the
+        # speed in the start segment and the time until its boundary node
+        self._travel_pos = self._up_pos
+        self._travel_cum_time = self._up_cum_time
+        self._travel_speed = 0.0
+        self._travel_boundary_index = 0
+        self._travel_boundary_time = 0.0
+
     def set_position(self, position):
         """Set known position of cover."""
         self.last_known_position = position
         self.travel_to_position = position
         self.position_type = PositionType.CONFIRMED
 
-    def stop(self):
-        """Stop traveling."""
-        self.last_known_position = self.current_position()
+    def stop(self, now=None):
+        """Stop traveling.
+
+        now may be passed by callers that already sampled the current time.
+        """
+        if self.travel_direction == self._STOPPED:
+            # last_known_position already holds the position
+            return
+        if self.position_type == self._CALCULATED:
+            if now is None:
+                now = self.current_time()
+            self.last_known_position = self._calculate_position(now)
         self.travel_to_position = self.last_known_position
         self.position_type = PositionType.CALCULATED
         self.travel_direction = TravelStatus.STOPPED
+        self._direction_sign = 0
 
     def start_travel(self, travel_to_position):
         """Start traveling to position."""
-        self.stop()
-        self.travel_started_time = self.current_time()
+        now = self.current_time()
+        self.stop(now)
+        self.travel_started_time = now
         self.travel_to_position = travel_to_position
         self.position_type = PositionType.CALCULATED
 
-        self.travel_direction = (
-            TravelStatus.DIRECTION_UP
-            if travel_to_position > self.last_known_position
-            else TravelStatus.DIRECTION_DOWN
-        )
+        if travel_to_position > self.last_known_position:
+            self.travel_direction = TravelStatus.DIRECTION_UP
+            self._direction_sign = 1
+            self._travel_pos, self._travel_cum_time = self._up_pos, self._up_cum_time
+            # First table node above the start position
+            boundary = bisect_right(self._travel_pos, self.last_known_position)
+        else:
+            self.travel_direction = TravelStatus.DIRECTION_DOWN
+            self._direction_sign = -1
+            self._travel_pos = self._down_pos
+            self._travel_cum_time = self._down_cum_time
+            # Last table node below the start position
+            boundary = bisect_left(self._travel_pos, self.last_known_position) - 1
+        self._start_segment(boundary)
+
+    def _start_segment(self, boundary):
+        """Set speed and time to the boundary node of the segment travel starts in.
+
+        Positions within the start segment are calculated relative to
+        last_known_position, so no precision is lost converting the start
+        position into table time and back.
+        """
+        pos, cum_time = self._travel_pos, self._travel_cum_time
+        other = boundary - self._direction_sign
+        self._travel_boundary_index = boundary
+        self._travel_speed = 0.0
+        if not 0 <= boundary < len(pos):
+            # Nothing left to travel in this direction
+            self._travel_boundary_time = float("inf")
+        elif not 0 <= other < len(pos) or cum_time[boundary] == cum_time[other]:
+            # Start outside the table or in a segment without duration
+            self._travel_boundary_time = 0.0
+        else:
+            self._travel_speed = (pos[boundary] - pos[other]) / (
+                cum_time[boundary] - cum_time[other]
+            )
+            self._travel_boundary_time = (
+                self._direction_sign
+                * (pos[boundary] - self.last_known_position)
+                / self._travel_speed
+            )
 
     def start_travel_up(self):
         """Start traveling up."""
@@ -120,8 +235,8 @@ class TravelCalculator:
 
     def current_position(self):
         """Return current (calculated or known) position."""
-        if self.position_type == PositionType.CALCULATED:
-            return self._calculate_position()
+        if self.position_type == self._CALCULATED:
+            return self._calculate_position(self.current_time())
         return self.last_known_position
 
     def is_traveling(self):
@@ -130,12 +245,11 @@ class TravelCalculator:
 
     def position_reached(self):
         """Return if cover has reached designated position."""
-        if self.travel_direction == TravelStatus.DIRECTION_UP:
-            return self.current_position() >= self.travel_to_position
-        elif self.travel_direction == TravelStatus.DIRECTION_DOWN:
-            return self.current_position() <= self.travel_to_position
-        else:
-            return self.current_position() == self.travel_to_position
+        # While stopped the current position always equals the target
+        return (
+            self._direction_sign * (self.current_position() - self.travel_to_position)
+            >= 0
+        )
 
     def is_open(self):
         """Return if cover is (fully) open."""
@@ -145,141 +259,69 @@ class TravelCalculator:
         """Return if cover is (fully) closed."""
         return self.current_position() == self.position_closed
 
-    def _calculate_position(self):
+    def _calculate_position(self, now):
         """Return calculated position using multi-segment travel."""
         relative_position = self.travel_to_position - self.last_known_position
 
-        def position_reached_or_exceeded(relative_position):
-            """Return if designated position was reached."""
-            if (
-                relative_position >= 0
-                and self.travel_direction == TravelStatus.DIRECTION_DOWN
-            ):
-                return True
-            if (
-                relative_position <= 0
-                and self.travel_direction == TravelStatus.DIRECTION_UP
-            ):
-                return True
-            return False
-
-        if position_reached_or_exceeded(relative_position):
+        # relative_position points against the travel direction once reached
+        if self._direction_sign * relative_position <= 0:
             return self.travel_to_position
 
-        elapsed_time = self.current_time() - self.travel_started_time
+        elapsed_time = now - self.travel_started_time
+        if elapsed_time <= 0:
+            return self.last_known_position
         position = self._position_from_time(elapsed_time)
 
         # Check if target reached
-        if self.travel_direction == TravelStatus.DIRECTION_UP:
-            if position >= self.travel_to_position:
-                return self.travel_to_position
-        else:
-            if position <= self.travel_to_position:
-                return self.travel_to_position
+        if self._direction_sign * (position - self.travel_to_position) >= 0:
+            return self.travel_to_position
         return int(position)
 
     def _position_from_time(self, elapsed_time):
-        """Calculate position from elapsed time using segments."""
-        segments = (
-            self.segments_up
-            if self.travel_direction == TravelStatus.DIRECTION_UP
-            else self.segments_down
-        )
-        start_pos = self.last_known_position
-        end_pos = self.travel_to_position
+        """Calculate position from elapsed time using precomputed segment tables.
 
-        # Calculate which segments we need to traverse
-        traversed_segments = self._calculate_traversed_segments(
-            segments, start_pos, end_pos
+        Both tables run from position 0 to 100, so travelling up adds the time
+        elapsed past the boundary node to its table time and travelling down
+        subtracts it.
+        """
+        if elapsed_time <= self._travel_boundary_time:
+            return (
+                self.last_known_position
+                + self._direction_sign * self._travel_speed * elapsed_time
+            )
+        return _interpolate(
+            self._travel_cum_time[self._travel_boundary_index]
+            + self._direction_sign * (elapsed_time - self._travel_boundary_time),
+            self._travel_cum_time,
+            self._travel_pos,
         )
-        if not traversed_segments:
-            return start_pos
-
-        # Calculate position based on elapsed time through segments
-        time_accumulated = 0
-        current_pos = start_pos
-
-        for seg_start, seg_end, seg_duration in traversed_segments:
-            if elapsed_time <= time_accumulated + seg_duration:
-                # We're in this segment
-                progress = (elapsed_time - time_accumulated) / seg_duration
-                position = seg_start + (seg_end - seg_start) * progress
-                return position
 
-            time_accumulated += seg_duration
-            current_pos = seg_end
+    @staticmethod
+    def _build_segment_tables(seg_pos, seg_dur):
+        """Return cumulative (positions, times) tables for the given segments.
 
-        return current_pos
-
-    def _calculate_traversed_segments(self, segments, start_pos, end_pos):
-        """Calculate which segments are traversed and their proportional durations.
-
-        Works for both upward and downward travel using symmetric segment definitions.
-        Segments are defined as [(position_end, duration), ...] from 0 to 100.
+        seg_pos and seg_dur hold the end position and duration of each segment,
+        defined from 0 to 100. Segments without width are not traversed, so
+        they are left out of the tables.
         """
-        is_going_up = self.travel_direction == TravelStatus.DIRECTION_UP
-        result = []
-
-        # Build segment ranges
-        segment_ranges = []
-        prev_pos = 0
-
-        for seg_end, seg_time in segments:
-            segment_ranges.append((prev_pos, seg_end, seg_time))
-            prev_pos = seg_end
-
-        # For downward travel, process segments in reverse order
-        ranges_to_process = segment_ranges if is_going_up else reversed(segment_ranges)
-
-        for seg_start, seg_end, seg_time in ranges_to_process:
-            if is_going_up:
-                # Skip segments entirely below our starting position
-                if seg_end <= start_pos:
-                    continue
-
-                # Calculate actual start and end within this segment
-                actual_start = max(seg_start, start_pos)
-                actual_end = min(seg_end, end_pos)
-
-                # Check if we have a valid range
-                if actual_end > actual_start:
-                    seg_range = seg_end - seg_start
-                    actual_range = actual_end - actual_start
-                    proportional_time = seg_time * (actual_range / seg_range)
-                    result.append((actual_start, actual_end, proportional_time))
-
-                # Stop if we've reached the end position
-                if seg_end >= end_pos:
-                    break
-            else:
-                # Skip segments entirely above our starting position
-                if seg_start >= start_pos:
-                    continue
-
-                # Calculate actual start and end within this segment
-                actual_start = min(start_pos, seg_end)
-                actual_end = max(end_pos, seg_start)
-
-                # Check if we have a valid range
-                if actual_start > actual_end:
-                    seg_range = seg_end - seg_start
-                    actual_range = actual_start - actual_end
-                    proportional_time = seg_time * (actual_range / seg_range)
-                    result.append((actual_start, actual_end, proportional_time))
-
-                # Stop if we've reached the end position
-                if seg_start <= end_pos:
-                    break
-
-        return result
+        positions = array("d", [0])
+        times = array("d", [0])
+        for i in range(len(seg_pos)):
+            if seg_pos[i] == positions[-1]:
+                continue
+            positions.append(seg_pos[i])
+            times.append(times[-1] + seg_dur[i])
+        return positions, times
 
     def current_time(self):
         """Get current time. May be modified from outside (for unit tests)."""
         # time_set_from_outside is  used within unit tests
         if self.time_set_from_outside is not None:
             return self.time_set_from_outside
-        return time.time()
+        return _MONOTONIC()
 
     def __eq__(self, other):
         """Equal operator."""
-        return self.__dict__ == other.__dict__
+        return tuple(getattr(self, name) for name in self.__slots__) == tuple(
+            getattr(other, name) for name in self.__slots__
+        )
@@ -0,0 +1 @@
+"""Tests for the cover_time_based_synced integration."""
@@ -0,0 +1,158 @@
+"""Tests for TravelCalculator."""
+
+import pytest
+
+from custom_components.cover_time_based_synced.travelcalculator import (
+    PositionType,
+    TravelCalculator,
+    TravelStatus,
+)
+
+CONFIGS = [
+    {"travel_time_up": 36, "travel_time_down": 34},
+    {
+        "segments_up": [(100, 10)],
+        "segments_down": [(35, 20), (59, 20), (100, 1)],
+    },
+    {
+        "segments_up": [(2, 1.45), (24, 17.09), (100, 7.88)],
+        "segments_down": [(77, 16.51), (83, 1.07), (100, 5.83)],
+    },
+]
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+@pytest.mark.parametrize("start", range(101))
+def test_position_unchanged_at_travel_start(config, start):
+    """Test position does not move at elapsed 0 or after an immediate stop."""
+    travelcalculator = TravelCalculator(**config)
+    travelcalculator.time_set_from_outside = 1000.0
+    travelcalculator.set_position(start)
+
+    for target in (0, 10, 50, 90, 100):
+        if target == start:
+            continue
+        for _ in range(10):
+            travelcalculator.start_travel(target)
+            assert travelcalculator.current_position() == start
+            travelcalculator.stop()
+            assert travelcalculator.current_position() == start
+
+
+def test_travel_down_single_segment():
+    """Test the travel example from the module docstring."""
+    travelcalculator = TravelCalculator(travel_time_down=100, travel_time_up=100)
+    travelcalculator.time_set_from_outside = 1000.0
+    travelcalculator.set_position(90)
+    travelcalculator.start_travel(60)
+
+    travelcalculator.time_set_from_outside = 1010.0
+    assert travelcalculator.current_position() == 80
+    assert not travelcalculator.position_reached()
+
+    travelcalculator.time_set_from_outside = 1020.0
+    assert travelcalculator.current_position() == 70
+
+    travelcalculator.time_set_from_outside = 1030.0
+    assert travelcalculator.current_position() == 60
+    assert travelcalculator.position_reached()
+    assert not travelcalculator.is_traveling()
+
+
+def test_travel_up_across_segments():
+    """Test travel through segments with different speeds."""
+    travelcalculator = TravelCalculator(
+        segments_up=[(50, 10), (100, 50)], travel_time_down=10
+    )
+    travelcalculator.time_set_from_outside = 1000.0
+    travelcalculator.set_position(40)
+    travelcalculator.start_travel_up()
+
+    travelcalculator.time_set_from_outside = 1002.0
+    assert travelcalculator.current_position() == 50
+
+    travelcalculator.time_set_from_outside = 1012.0
+    assert travelcalculator.current_position() == 60
+
+    travelcalculator.time_set_from_outside = 1052.0
+    assert travelcalculator.is_open()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"travel_time_up": 30, "travel_time_down": 30},
+        {"segments_up": [(50, 15), (100, 15)], "segments_down": [(50, 15), (100, 15)]},
+    ],
+)
+def test_travel_down_from_above_open(config):
+    """Test travel starting above position 100 continues from the open end."""
+    travelcalculator = TravelCalculator(**config)
+    travelcalculator.time_set_from_outside = 1000.0
+    travelcalculator.set_position(120)
+    travelcalculator.start_travel(50)
+
+    travelcalculator.time_set_from_outside = 1005.0
+    assert travelcalculator.current_position() == 83
+    assert travelcalculator.is_traveling()
+
+    travelcalculator.time_set_from_outside = 1015.0
+    assert travelcalculator.current_position() == 50
+    assert not travelcalculator.is_traveling()
+
+
+def test_zero_width_segment_is_skipped():
+    """Test segments repeating the previous end position take no time."""
+    travelcalculator = TravelCalculator(
+        segments_up=[(0, 5), (50, 10), (50, 10), (100, 10)], travel_time_down=10
+    )
+    travelcalculator.time_set_from_outside = 1000.0
+    travelcalculator.set_position(0)
+    travelcalculator.start_travel_up()
+
+    positions = []
+    for elapsed in (5, 15, 25, 30):
+        travelcalculator.time_set_from_outside = 1000.0 + elapsed
+        positions.append(travelcalculator.current_position())
+    assert positions == [25, 75, 100, 100]
+
+
+def test_stop_while_stopped_keeps_state():
+    """Test stopping a stopped calculator leaves position and type unchanged."""
+    travelcalculator = TravelCalculator(travel_time_down=30, travel_time_up=30)
+    travelcalculator.stop()
+    assert travelcalculator.position_type == PositionType.UNKNOWN
+    assert travelcalculator.last_known_position == 0
+
+    travelcalculator.set_position(40)
+    travelcalculator.stop()
+    assert travelcalculator.position_type == PositionType.CONFIRMED
+    assert travelcalculator.last_known_position == 40
+    assert travelcalculator.current_position() == 40
+
+
+def test_start_travel_samples_clock_once(monkeypatch):
+    """Test start_travel stops and restarts travel at a single timestamp."""
+    travelcalculator = TravelCalculator(travel_time_down=100, travel_time_up=100)
+    travelcalculator.time_set_from_outside = 1000.0
+    travelcalculator.set_position(0)
+    travelcalculator.start_travel_up()
+
+    calls = []
+
+    def current_time(self):
+        calls.append(None)
+        return 1010.0 + len(calls)
+
+    monkeypatch.setattr(TravelCalculator, "current_time", current_time)
+    travelcalculator.start_travel(0)
+
+    assert len(calls) == 1
+    assert travelcalculator.travel_started_time == 1011.0
+    assert travelcalculator.last_known_position == 11
+    assert travelcalculator.travel_direction == TravelStatus.DIRECTION_DOWN
+
+
+def test_enums_do_not_compare_across_types():
+    """Test members of different enums with equal values are not equal."""
+    assert PositionType.CALCULATED != TravelStatus.DIRECTION_DOWN